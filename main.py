@@ -1,10 +1,21 @@
 import os
-import json
 import argparse
 import random
-
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime
+from functools import partial, wraps
+
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import yaml
 import spotipy
+from spotipy.cache_handler import CacheFileHandler
 from spotipy.oauth2 import SpotifyOAuth
 from tqdm import tqdm
 
@@ -16,87 +27,314 @@ def load_config(filepath='config.yaml'):
 
 
 def save_json(filepath, data):
-    """Save data to a JSON file."""
-    with open(filepath, 'w') as f:
-        json.dump(data, f, indent=4)
+    """Save data to a JSON file.
+
+    The data is written to a temporary file first and then renamed over the
+    target, so an interrupted run never leaves a half-written file behind.
+    """
+    tmp_filepath = filepath + '.tmp'
+    with open(tmp_filepath, 'wb') as f:
+        f.write(orjson.dumps(data))
+    os.replace(tmp_filepath, filepath)
 
 
 def load_json(filepath):
     """Load data from a JSON file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def iter_files(directory, suffix):
+    """Lazily yield the paths of files in a directory whose names end with the suffix."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix):
+                yield entry.path
+
+
+# Columnar layout for stored playlist tracks, keeping only the fields used downstream
+PLAYLIST_TRACKS_SCHEMA = pa.schema([
+    ('track_id', pa.string()),
+    ('name', pa.string()),
+    ('artist_ids', pa.list_(pa.string())),
+    ('added_at', pa.timestamp('s', tz='UTC')),
+])
+
+
+def save_playlist_tracks(filepath, playlist_tracks):
+    """Save playlist tracks to a Parquet file."""
+    items = [item for item in playlist_tracks if item['track']]
+    table = pa.table({
+        'track_id': [item['track']['id'] for item in items],
+        'name': [item['track']['name'] for item in items],
+        'artist_ids': [[artist['id'] for artist in item['track']['artists'] or []] for item in items],
+        'added_at': [datetime.fromisoformat(item['added_at']) if item['added_at'] else None for item in items],
+    }, schema=PLAYLIST_TRACKS_SCHEMA)
+    tmp_filepath = filepath + '.tmp'
+    pq.write_table(table, tmp_filepath, compression='zstd', use_dictionary=True)
+    os.replace(tmp_filepath, filepath)
+
+
+def load_playlist_tracks(filepath, columns=None):
+    """Load playlist tracks from a Parquet file, reading only the requested columns."""
+    return pq.read_table(filepath, columns=columns)
+
+
+def migrate_legacy_playlists(playlist_dir='spotify/playlists'):
+    """Convert playlists saved as JSON track arrays by older versions into Parquet files."""
+    legacy_filepaths = [filepath for filepath in iter_files(playlist_dir, '.json')
+                        if not filepath.endswith('.meta.json')]
+    for filepath in legacy_filepaths:
+        parquet_filepath = filepath.removesuffix('.json') + '.parquet'
+        # A Parquet file already there was written after the upgrade and is newer than the legacy one
+        if not os.path.exists(parquet_filepath):
+            save_playlist_tracks(parquet_filepath, load_json(filepath))
+        os.remove(filepath)
+    if legacy_filepaths:
+        print(f"Converted {len(legacy_filepaths)} playlists from the old JSON format.")
+
+
+class RateLimiter:
+    """Token bucket that caps both the request rate and the number of requests in flight."""
+
+    def __init__(self, rate=10, per=1.0, concurrency=4):
+        self.interval = per / rate
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.lock = threading.Lock()
+        self.next_token_at = time.monotonic()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        self.slots.acquire()
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_token_at - now
+            self.next_token_at = max(self.next_token_at, now) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def release(self):
+        """Mark an in-flight request as finished."""
+        self.slots.release()
+
+    def pause(self, seconds):
+        """Hold back every caller for the given number of seconds."""
+        with self.lock:
+            self.next_token_at = max(self.next_token_at, time.monotonic() + seconds)
+
+
+spotify_limiter = RateLimiter(rate=10, per=1.0, concurrency=4)
+
+
+def rate_limited(limiter):
+    """Decorator that throttles calls through the limiter and retries on HTTP 429."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            while True:
+                limiter.acquire()
+                try:
+                    return func(*args, **kwargs)
+                except spotipy.SpotifyException as e:
+                    if e.http_status != 429:
+                        raise
+                    retry_after = int((e.headers or {}).get('Retry-After', 1))
+                    limiter.pause(retry_after)
+                finally:
+                    limiter.release()
+        return wrapper
+    return decorator
+
+
+class RateLimitedSpotify(spotipy.Spotify):
+    """Spotify client that sends every API call through the shared rate limiter."""
+
+    def __init__(self, *args, **kwargs):
+        # Leave 429 out of spotipy's own retries so Retry-After reaches the limiter
+        kwargs.setdefault('status_forcelist', (500, 502, 503, 504))
+        super().__init__(*args, **kwargs)
+
+    def _build_session(self):
+        super()._build_session()
+        # urllib3 retries any 429 carrying Retry-After regardless of status_forcelist,
+        # sleeping while holding a limiter slot, so stop it from honouring the header
+        for prefix in ('http://', 'https://'):
+            adapter = self._session.get_adapter(prefix)
+            adapter.max_retries = adapter.max_retries.new(respect_retry_after_header=False)
+
+    @rate_limited(spotify_limiter)
+    def _internal_call(self, method, url, payload, params):
+        return super()._internal_call(method, url, payload, params)
+
+
+class MemoryCacheFileHandler(CacheFileHandler):
+    """Token cache that is read from disk once and then served from memory.
+
+    Tokens are still written through to the cache file, so the refresh token
+    survives across CLI invocations.
+    """
+
+    def __init__(self, cache_path='.spotipy_cache'):
+        super().__init__(cache_path=cache_path)
+        self.token_info = None
+
+    def get_cached_token(self):
+        if self.token_info is None:
+            self.token_info = super().get_cached_token()
+        return self.token_info
+
+    def save_token_to_cache(self, token_info):
+        self.token_info = token_info
+        super().save_token_to_cache(token_info)
+
+
+class SharedSpotifyOAuth(SpotifyOAuth):
+    """OAuth manager that lets concurrent requests share a single token refresh."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.token_lock = threading.Lock()
+
+    def get_access_token(self, *args, **kwargs):
+        # Only one thread refreshes an expiring token; the rest wait and reuse it
+        with self.token_lock:
+            return super().get_access_token(*args, **kwargs)
 
 
 def authenticate_spotify(client_id, client_secret, redirect_uri, scope='playlist-read-private'):
     """Authenticate the user with Spotify using OAuth."""
-    return spotipy.Spotify(auth_manager=SpotifyOAuth(client_id=client_id,
-                                                     client_secret=client_secret,
-                                                     redirect_uri=redirect_uri,
-                                                     scope=scope))
+    auth_manager = SharedSpotifyOAuth(client_id=client_id,
+                                      client_secret=client_secret,
+                                      redirect_uri=redirect_uri,
+                                      scope=scope,
+                                      cache_handler=MemoryCacheFileHandler())
+    return RateLimitedSpotify(auth_manager=auth_manager)
+
+
+def fetch_all_pages(fetch_page, limit, first_page=None, max_workers=4):
+    """Fetch every item of a paginated endpoint.
+
+    The first page tells us the total, so the remaining offsets are requested
+    concurrently instead of one round trip after another. A first page that
+    came embedded in another response can be passed in to save its request.
+    """
+    if first_page is None:
+        first_page = fetch_page(limit=limit, offset=0)
+    items = list(first_page['items'])
+    offsets = range(limit, first_page['total'], limit)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for page in executor.map(lambda offset: fetch_page(limit=limit, offset=offset), offsets):
+            items.extend(page['items'])
+    return items
+
+
+# Only the track fields used downstream, instead of full track objects with album art and markets
+PLAYLIST_TRACK_FIELDS = 'items(added_at,track(id,name,artists(id,name))),next,total'
+
+
+def fetch_playlist_tracks(sp, playlist_id, first_page=None):
+    """Fetch all tracks of a playlist."""
+    return fetch_all_pages(partial(sp.playlist_tracks, playlist_id, fields=PLAYLIST_TRACK_FIELDS), limit=100,
+                           first_page=first_page)
+
+
+def fetch_playlist_snapshot(sp, playlist_id):
+    """Fetch all tracks of a playlist together with the snapshot id they were read from.
+
+    The snapshot id and the first page of tracks come from the same response,
+    so the stored snapshot id matches the tracks that were actually saved.
+    """
+    playlist = sp.playlist(playlist_id, fields=f'snapshot_id,tracks({PLAYLIST_TRACK_FIELDS})')
+    return playlist['snapshot_id'], fetch_playlist_tracks(sp, playlist_id, first_page=playlist['tracks'])
+
+
+# Enough of a playlist to tell whether it changed since it was last downloaded
+PLAYLIST_SNAPSHOT_FIELDS = 'id,name,snapshot_id'
+
+
+def save_playlist_meta(playlist):
+    """Save the playlist metadata kept next to its tracks.
+
+    Listing playlists reads only these files, and refresh compares the stored
+    snapshot id to skip playlists that have not changed.
+    """
+    save_json(f'spotify/playlists/{playlist["id"]}.meta.json', {
+        'id': playlist['id'],
+        'name': playlist['name'],
+        'snapshot_id': playlist['snapshot_id'],
+    })
+
+
+def get_user_id(sp, filepath='spotify/user_id.txt', use_saved=True):
+    """Return the current user's id, asking Spotify only if it has not been saved locally yet."""
+    if use_saved and os.path.exists(filepath):
+        with open(filepath, 'r') as f:
+            return f.read().strip()
+
+    user_id = sp.current_user()["id"]
+    tmp_filepath = filepath + '.tmp'
+    with open(tmp_filepath, 'w') as f:
+        f.write(user_id)
+    os.replace(tmp_filepath, filepath)
+    return user_id
 
 
 def fetch_user_playlists(sp):
     """Fetch all playlists created by the user."""
-    user_id = sp.current_user()["id"]
-    playlists = []
-    offset = 0
-    while True:
-        response = sp.current_user_playlists(limit=50, offset=offset)
-        playlists.extend(response['items'])
-        offset += len(response['items'])
-        if len(response['items']) == 0:
-            break
+    user_id = get_user_id(sp)
+    playlists = fetch_all_pages(sp.current_user_playlists, limit=50)
     # Filter playlists that are owned by the user
-    return [playlist for playlist in playlists if playlist['owner']['id'] == user_id]
+    owned_playlists = [playlist for playlist in playlists if playlist['owner']['id'] == user_id]
+    if playlists and not owned_playlists:
+        # The saved id may belong to an account the user has since logged out of
+        user_id = get_user_id(sp, use_saved=False)
+        owned_playlists = [playlist for playlist in playlists if playlist['owner']['id'] == user_id]
+    return owned_playlists
 
 
-def confirm_prompt(prompt_text):
-    """Prompt the user with a yes/no question and handle different variations of input."""
-    yes_responses = {"yes", "y", "ye", "yeah", "yep", "sure", "ok", "okay"}
-    no_responses = {"no", "n", "nah", "nope", "cancel"}
-    
+YES_RESPONSES = frozenset({"yes", "y", "ye", "yeah", "yep", "sure", "ok", "okay"})
+NO_RESPONSES = frozenset({"no", "n", "nah", "nope", "cancel"})
+
+
+def confirm_prompt(prompt_text, *, assume=None):
+    """Prompt the user with a yes/no question and handle different variations of input.
+
+    If ``assume`` is set, it is returned without prompting.
+    """
+    if assume is not None:
+        return assume
+
     while True:
         response = input(f"{prompt_text} (yes/no): ").strip().lower()
-        if response in yes_responses:
+        if response in YES_RESPONSES:
             return True
-        elif response in no_responses:
+        elif response in NO_RESPONSES:
             return False
         else:
             print("Please respond with 'yes' or 'no'.")
 
 
 def fetch_and_save_playlist_tracks(sp, playlist, existing_artist_ids):
-    """Fetch tracks from a playlist and save them to a JSON file."""
+    """Fetch tracks from a playlist and save them to a Parquet file."""
     playlist_id = playlist['id']
-    playlist_name = playlist['name']
+    playlist_tracks = fetch_playlist_tracks(sp, playlist_id)
 
-    if not confirm_prompt(f"Do you want to download the playlist '{playlist_name}'?"):
-        print(f"Skipping playlist '{playlist_name}'")
-        return set()
-
-    playlist_tracks = []
-    offset = 0
-    while True:
-        response = sp.playlist_tracks(playlist_id, limit=100, offset=offset)
-        tracks = response['items']
-        playlist_tracks.extend(tracks)
-        offset += len(tracks)
-        if len(tracks) == 0:
-            break
+    # Save tracks to a local Parquet file
+    playlist_filepath = f'spotify/playlists/{playlist_id}.parquet'
+    save_playlist_tracks(playlist_filepath, playlist_tracks)
 
-    # Save tracks to a local JSON file
-    os.makedirs('spotify/playlists', exist_ok=True)
-    playlist_filepath = f'spotify/playlists/{playlist_id}.json'
-    save_json(playlist_filepath, playlist_tracks)
+    save_playlist_meta(playlist)
 
-    # Collect unique artist IDs from the tracks
+    # Collect unique artist IDs and song IDs from the tracks
     unique_artists = set()
+    song_ids = set()
     for track in playlist_tracks:
-        if track['track'] and track['track']['artists']:
-            for artist in track['track']['artists']:
+        if track['track']:
+            song_ids.add(track['track']['id'])
+            for artist in track['track']['artists'] or []:
                 if artist['id'] not in existing_artist_ids:
                     unique_artists.add(artist['id'])
-    return unique_artists
+    return unique_artists, song_ids
 
 
 def fetch_and_save_artist_data(sp, unique_artists, artist_filepath):
@@ -104,34 +342,105 @@ def fetch_and_save_artist_data(sp, unique_artists, artist_filepath):
     artist_data = load_json(artist_filepath) if os.path.exists(artist_filepath) else []
     existing_artist_ids = {artist['id'] for artist in artist_data}
 
-    new_artist_ids = unique_artists - existing_artist_ids
+    new_artist_ids = list(unique_artists - existing_artist_ids)
     new_artist_data = []
 
     # Spotify API limits bulk artist lookup to 50 at a time
     for i in tqdm(range(0, len(new_artist_ids), 50), desc="Fetching Artist Data"):
-        batch = list(new_artist_ids)[i:i + 50]
+        batch = new_artist_ids[i:i + 50]
         response = sp.artists(batch)
         new_artist_data.extend(response['artists'])
 
     # Append new data and save
     artist_data.extend(new_artist_data)
-    os.makedirs('spotify/artists', exist_ok=True)
     save_json(artist_filepath, artist_data)
 
 
+# Audio feature columns stored per song, alongside the song id
+FEATURE_COLUMNS = (
+    ('danceability', 'REAL'),
+    ('energy', 'REAL'),
+    ('key', 'INTEGER'),
+    ('loudness', 'REAL'),
+    ('mode', 'INTEGER'),
+    ('speechiness', 'REAL'),
+    ('acousticness', 'REAL'),
+    ('instrumentalness', 'REAL'),
+    ('liveness', 'REAL'),
+    ('valence', 'REAL'),
+    ('tempo', 'REAL'),
+    ('duration_ms', 'INTEGER'),
+    ('time_signature', 'INTEGER'),
+)
+
+
+def open_features_db(filepath='spotify/features.db'):
+    """Open the song features database, creating the features table if needed."""
+    conn = sqlite3.connect(filepath)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    columns = ', '.join(f'{name} {type_}' for name, type_ in FEATURE_COLUMNS)
+    conn.execute(f'CREATE TABLE IF NOT EXISTS features (id TEXT PRIMARY KEY, {columns})')
+    return conn
+
+
+def insert_features(conn, features):
+    """Insert or replace feature records in the features table, in a single transaction."""
+    column_names = ['id'] + [name for name, _ in FEATURE_COLUMNS]
+    insert_sql = (f'INSERT OR REPLACE INTO features ({", ".join(column_names)}) '
+                  f'VALUES ({", ".join("?" for _ in column_names)})')
+    rows = [[feature.get(name) for name in column_names] for feature in features if feature]
+    with conn:
+        conn.executemany(insert_sql, rows)
+
+
+def migrate_legacy_features(conn, features_dir='spotify/features'):
+    """Import the per-song feature files written by older versions, then remove them."""
+    if not os.path.exists(features_dir):
+        return
+    legacy_filepaths = list(iter_files(features_dir, '.json'))
+    insert_features(conn, [load_json(filepath) for filepath in legacy_filepaths])
+    for filepath in legacy_filepaths:
+        os.remove(filepath)
+    if not os.listdir(features_dir):
+        os.rmdir(features_dir)
+    if legacy_filepaths:
+        print(f"Imported features for {len(legacy_filepaths)} songs from the old per-song files.")
+
+
 def fetch_song_features(sp, song_ids):
-    """Fetch song features in bulk and save to individual JSON files."""
-    os.makedirs('spotify/features', exist_ok=True)
-    for i in tqdm(range(0, len(song_ids), 100), desc="Fetching Song Features"):
-        batch = song_ids[i:i + 100]
-        features = sp.audio_features(batch)
-        for feature in features:
-            if feature:
-                feature_filepath = f'spotify/features/{feature["id"]}.json'
-                save_json(feature_filepath, feature)
-
-
-def pull(sp):
+    """Fetch song features in bulk and save them to the features database."""
+    with closing(open_features_db()) as conn:
+        migrate_legacy_features(conn)
+
+        # Features never change, so only request songs that have not been fetched before
+        existing_song_ids = {row[0] for row in conn.execute('SELECT id FROM features')}
+        song_ids = [song_id for song_id in song_ids if song_id not in existing_song_ids]
+
+        for i in tqdm(range(0, len(song_ids), 100), desc="Fetching Song Features"):
+            batch = song_ids[i:i + 100]
+            insert_features(conn, sp.audio_features(batch))
+
+
+def select_playlists(user_playlists, assume=None):
+    """Ask which playlists to download, remembering accepted ones so they are not asked about again."""
+    allowed_filepath = 'spotify/allowed_playlists.json'
+    allowed_playlist_ids = set(load_json(allowed_filepath)) if os.path.exists(allowed_filepath) else set()
+
+    selected_playlists = []
+    for playlist in user_playlists:
+        if playlist['id'] in allowed_playlist_ids or confirm_prompt(
+                f"Do you want to download the playlist '{playlist['name']}'?", assume=assume):
+            selected_playlists.append(playlist)
+            allowed_playlist_ids.add(playlist['id'])
+        else:
+            print(f"Skipping playlist '{playlist['name']}'")
+
+    save_json(allowed_filepath, sorted(allowed_playlist_ids))
+    return selected_playlists
+
+
+def pull(sp, assume=None):
     """Interactive command to fetch playlists, tracks, artists, and song features."""
     user_playlists = fetch_user_playlists(sp)
     
@@ -140,20 +449,19 @@ def pull(sp):
     existing_artist_data = load_json(artist_filepath) if os.path.exists(artist_filepath) else []
     existing_artist_ids = {artist['id'] for artist in existing_artist_data}
 
+    # Settle every prompt up front so the downloads are not held up waiting for input
+    selected_playlists = select_playlists(user_playlists, assume=assume)
+
     # Process each playlist
     all_unique_artists = set()
     all_song_ids = set()
 
-    for playlist in tqdm(user_playlists, desc="Processing Playlists"):
-        unique_artists = fetch_and_save_playlist_tracks(sp, playlist, existing_artist_ids)
-        all_unique_artists.update(unique_artists)
-
-        # Collect song IDs for fetching features later
-        playlist_filepath = f'spotify/playlists/{playlist["id"]}.json'
-        playlist_tracks = load_json(playlist_filepath)
-        for track in playlist_tracks:
-            if track['track']:
-                all_song_ids.add(track['track']['id'])
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = executor.map(partial(fetch_and_save_playlist_tracks, sp, existing_artist_ids=existing_artist_ids),
+                               selected_playlists)
+        for unique_artists, song_ids in tqdm(results, total=len(selected_playlists), desc="Processing Playlists"):
+            all_unique_artists.update(unique_artists)
+            all_song_ids.update(song_ids)
 
     # Fetch and save artist data
     fetch_and_save_artist_data(sp, all_unique_artists, artist_filepath)
@@ -175,35 +483,49 @@ def refresh(sp):
     all_song_ids = set()
 
     if os.path.exists(playlist_dir):
-        for filename in os.listdir(playlist_dir):
-            if filename.endswith('.json'):
-                playlist_id = filename.replace('.json', '')
-                print(f"Refreshing playlist {playlist_id}...")
-                playlist_tracks = []
-                offset = 0
-                while True:
-                    response = sp.playlist_tracks(playlist_id, limit=100, offset=offset)
-                    tracks = response['items']
-                    playlist_tracks.extend(tracks)
-                    offset += len(tracks)
-                    if len(tracks) == 0:
-                        break
-
+        playlist_ids = (os.path.basename(filepath).removesuffix('.parquet')
+                        for filepath in iter_files(playlist_dir, '.parquet'))
+
+        # Compare snapshots first so playlists that have not changed are not downloaded again
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            playlists = list(executor.map(partial(sp.playlist, fields=PLAYLIST_SNAPSHOT_FIELDS), playlist_ids))
+
+        changed_playlists = []
+        for playlist in playlists:
+            meta_filepath = os.path.join(playlist_dir, f'{playlist["id"]}.meta.json')
+            stored_meta = load_json(meta_filepath) if os.path.exists(meta_filepath) else {}
+            if stored_meta.get('snapshot_id') != playlist['snapshot_id']:
+                changed_playlists.append(playlist)
+                continue
+
+            # Unchanged playlists still contribute their artists and songs, read from the stored columns
+            playlist_filepath = os.path.join(playlist_dir, f'{playlist["id"]}.parquet')
+            stored_tracks = load_playlist_tracks(playlist_filepath, columns=['track_id', 'artist_ids'])
+            all_song_ids.update(stored_tracks.column('track_id').to_pylist())
+            artist_ids = set(pc.list_flatten(stored_tracks.column('artist_ids')).to_pylist())
+            all_unique_artists.update(artist_ids - existing_artist_ids)
+
+        print(f"{len(changed_playlists)} of {len(playlists)} playlists changed since the last download.")
+
+        # Playlists are independent of each other, so refresh several at once
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            changed_ids = [playlist['id'] for playlist in changed_playlists]
+            refreshed = executor.map(partial(fetch_playlist_snapshot, sp), changed_ids)
+            for playlist, (snapshot_id, playlist_tracks) in tqdm(zip(changed_playlists, refreshed),
+                                                                 total=len(changed_playlists),
+                                                                 desc="Refreshing Playlists"):
                 # Save updated playlist tracks
-                playlist_filepath = os.path.join(playlist_dir, filename)
-                save_json(playlist_filepath, playlist_tracks)
+                playlist_filepath = os.path.join(playlist_dir, f'{playlist["id"]}.parquet')
+                save_playlist_tracks(playlist_filepath, playlist_tracks)
+                save_playlist_meta({**playlist, 'snapshot_id': snapshot_id})
 
-                # Collect unique artist IDs from the tracks
-                for track in playlist_tracks:
-                    if track['track'] and track['track']['artists']:
-                        for artist in track['track']['artists']:
-                            if artist['id'] not in existing_artist_ids:
-                                all_unique_artists.add(artist['id'])
-
-                # Collect song IDs for fetching features later
+                # Collect unique artist IDs and song IDs from the tracks
                 for track in playlist_tracks:
                     if track['track']:
                         all_song_ids.add(track['track']['id'])
+                        for artist in track['track']['artists'] or []:
+                            if artist['id'] not in existing_artist_ids:
+                                all_unique_artists.add(artist['id'])
 
     # Fetch and save artist data
     fetch_and_save_artist_data(sp, all_unique_artists, artist_filepath)
@@ -223,15 +545,14 @@ def stop_playback(sp, device_id):
 
 
 def load_local_playlists():
-    """Load playlists stored locally."""
-    playlists = []
+    """Load the id and name of playlists stored locally, without reading their tracks."""
     playlists_dir = 'spotify/playlists'
-    if os.path.exists(playlists_dir):
-        for file in os.listdir(playlists_dir):
-            if file.endswith('.json'):
-                filepath = os.path.join(playlists_dir, file)
-                playlists.append(load_json(filepath))
-    return playlists
+    if not os.path.exists(playlists_dir):
+        return []
+
+    # Reading and decoding the files in parallel overlaps disk waits with parsing
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(load_json, iter_files(playlists_dir, '.meta.json')))
 
 
 def load_local_liked_songs():
@@ -306,8 +627,16 @@ def main():
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description='Spotify Playlist and Song Data CLI')
     parser.add_argument('command', choices=['pull', 'refresh', 'tag'], help='Command to execute')
+    parser.add_argument('-y', '--yes', action='store_true', help='Download every playlist without prompting')
     args = parser.parse_args()
 
+    # Create the local data directories once, rather than on every save
+    for directory in ('spotify/playlists', 'spotify/artists'):
+        os.makedirs(directory, exist_ok=True)
+
+    # Bring stores written by older versions up to date before any command reads them
+    migrate_legacy_playlists()
+
     # Load configuration
     config = load_config('config.yaml')
     CLIENT_ID = config['spotify']['client_id']
@@ -319,7 +648,7 @@ def main():
 
     # Execute the chosen command
     if args.command == 'pull':
-        pull(sp)
+        pull(sp, assume=True if args.yes else None)
     elif args.command == 'refresh':
         refresh(sp)
     elif args.command == 'tag':
@@ -0,0 +1,30 @@
+from contextlib import closing
+
+import orjson
+
+import main
+
+
+class FakeSpotify:
+    def __init__(self):
+        self.requested = []
+
+    def audio_features(self, song_ids):
+        self.requested.extend(song_ids)
+        return [{'id': song_id, 'danceability': 0.5, 'tempo': 120.0} for song_id in song_ids]
+
+
+def test_legacy_feature_files_are_imported_instead_of_refetched(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    features_dir = tmp_path / 'spotify' / 'features'
+    features_dir.mkdir(parents=True)
+    (features_dir / 'old.json').write_bytes(orjson.dumps({'id': 'old', 'danceability': 0.9, 'key': 5}))
+
+    sp = FakeSpotify()
+    main.fetch_song_features(sp, ['old', 'new'])
+
+    assert sp.requested == ['new']
+    assert not features_dir.exists()
+    with closing(main.open_features_db()) as conn:
+        rows = dict(conn.execute('SELECT id, danceability FROM features'))
+    assert rows == {'old': 0.9, 'new': 0.5}
@@ -0,0 +1,29 @@
+import main
+
+
+def make_page(offset, count, total):
+    items = [{'added_at': None, 'track': {'id': f't{i}', 'name': f'Song {i}', 'artists': []}}
+             for i in range(offset, offset + count)]
+    return {'items': items, 'next': None, 'total': total}
+
+
+class FakeSpotify:
+    def __init__(self):
+        self.playlist_tracks_offsets = []
+
+    def playlist(self, playlist_id, fields=None):
+        return {'snapshot_id': 'snap-2', 'tracks': make_page(0, 100, 150)}
+
+    def playlist_tracks(self, playlist_id, fields=None, limit=100, offset=0):
+        self.playlist_tracks_offsets.append(offset)
+        return make_page(offset, min(limit, 150 - offset), 150)
+
+
+def test_fetch_playlist_snapshot_reuses_the_embedded_first_page():
+    sp = FakeSpotify()
+
+    snapshot_id, tracks = main.fetch_playlist_snapshot(sp, 'playlist1')
+
+    assert snapshot_id == 'snap-2'
+    assert [item['track']['id'] for item in tracks] == [f't{i}' for i in range(150)]
+    assert sp.playlist_tracks_offsets == [100]
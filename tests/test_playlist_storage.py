@@ -0,0 +1,49 @@
+import orjson
+
+import main
+
+
+def make_item(track_id, artists):
+    return {
+        'added_at': '2024-01-02T03:04:05Z',
+        'track': {'id': track_id, 'name': f'Song {track_id}', 'artists': artists},
+    }
+
+
+def test_save_playlist_tracks_tolerates_missing_artists(tmp_path):
+    filepath = str(tmp_path / 'playlist.parquet')
+    main.save_playlist_tracks(filepath, [
+        make_item('a', [{'id': 'artist1', 'name': 'Artist 1'}]),
+        make_item('b', None),
+        {'added_at': None, 'track': None},
+    ])
+
+    table = main.load_playlist_tracks(filepath)
+    assert table.column('track_id').to_pylist() == ['a', 'b']
+    assert table.column('artist_ids').to_pylist() == [['artist1'], []]
+
+
+def test_migrate_legacy_playlists_converts_json_track_arrays(tmp_path):
+    legacy_filepath = tmp_path / 'playlist1.json'
+    legacy_filepath.write_bytes(orjson.dumps([make_item('a', [{'id': 'artist1', 'name': 'Artist 1'}])]))
+    meta_filepath = tmp_path / 'playlist2.meta.json'
+    meta_filepath.write_bytes(orjson.dumps({'id': 'playlist2', 'name': 'Kept'}))
+
+    main.migrate_legacy_playlists(str(tmp_path))
+
+    assert not legacy_filepath.exists()
+    assert meta_filepath.exists()
+    table = main.load_playlist_tracks(str(tmp_path / 'playlist1.parquet'))
+    assert table.column('track_id').to_pylist() == ['a']
+
+
+def test_migrate_legacy_playlists_keeps_newer_parquet(tmp_path):
+    parquet_filepath = str(tmp_path / 'playlist1.parquet')
+    main.save_playlist_tracks(parquet_filepath, [make_item('new', [])])
+    legacy_filepath = tmp_path / 'playlist1.json'
+    legacy_filepath.write_bytes(orjson.dumps([make_item('old', [])]))
+
+    main.migrate_legacy_playlists(str(tmp_path))
+
+    assert not legacy_filepath.exists()
+    assert main.load_playlist_tracks(parquet_filepath).column('track_id').to_pylist() == ['new']
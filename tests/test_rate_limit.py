@@ -0,0 +1,57 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+import main
+
+
+class RateLimitStub(BaseHTTPRequestHandler):
+    """Answers the first request with 429 and every later one with an empty JSON object."""
+
+    hits = []
+
+    def do_GET(self):
+        self.hits.append(time.monotonic())
+        if len(self.hits) == 1:
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            body = b'{}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    RateLimitStub.hits = []
+    server = HTTPServer(('127.0.0.1', 0), RateLimitStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_429_is_retried_by_the_limiter_after_retry_after(stub_server, monkeypatch):
+    pauses = []
+    pause = main.spotify_limiter.pause
+    monkeypatch.setattr(main.spotify_limiter, 'pause', lambda seconds: (pauses.append(seconds), pause(seconds)))
+
+    sp = main.RateLimitedSpotify(auth='token')
+    sp.prefix = f'http://127.0.0.1:{stub_server.server_port}/v1/'
+
+    assert sp.current_user() == {}
+    # urllib3 must not retry the 429 itself; the limiter sees it once with the server's Retry-After
+    assert len(RateLimitStub.hits) == 2
+    assert pauses == [1]
+    assert RateLimitStub.hits[1] - RateLimitStub.hits[0] >= 1
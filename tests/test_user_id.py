@@ -0,0 +1,36 @@
+import main
+
+
+class FakeSpotify:
+    def __init__(self, user_id, playlists):
+        self.user_id = user_id
+        self.playlists = playlists
+        self.current_user_calls = 0
+
+    def current_user(self):
+        self.current_user_calls += 1
+        return {'id': self.user_id}
+
+    def current_user_playlists(self, limit, offset):
+        return {'items': self.playlists[offset:offset + limit], 'total': len(self.playlists)}
+
+
+def test_saved_user_id_is_reused(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'spotify').mkdir()
+    sp = FakeSpotify('me', [{'id': 'p1', 'owner': {'id': 'me'}}, {'id': 'p2', 'owner': {'id': 'other'}}])
+
+    assert [playlist['id'] for playlist in main.fetch_user_playlists(sp)] == ['p1']
+    assert [playlist['id'] for playlist in main.fetch_user_playlists(sp)] == ['p1']
+    assert sp.current_user_calls == 1
+
+
+def test_stale_user_id_is_refetched_when_no_playlist_matches(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'spotify').mkdir()
+    (tmp_path / 'spotify' / 'user_id.txt').write_text('previous-account')
+    sp = FakeSpotify('me', [{'id': 'p1', 'owner': {'id': 'me'}}])
+
+    assert [playlist['id'] for playlist in main.fetch_user_playlists(sp)] == ['p1']
+    assert (tmp_path / 'spotify' / 'user_id.txt').read_text() == 'me'
+    assert not (tmp_path / 'spotify' / 'user_id.txt.tmp').exists()